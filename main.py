@@ -47,7 +47,7 @@ def main():
     args = parse_arguments()
     
     # Set up logging
-    logger = Logger(level=args.log_level, log_file=args.log_file)
+    logger = Logger(level=args.log_level, log_file=args.log_file, console=True)
     logger.info("Bird Sort Game starting...")
     
     # Validate arguments
@@ -214,6 +214,7 @@ def main():
     # Output performance metrics if requested
     if profiling_enabled:
         memory_profiler.stop()
+        metrics.close()
         metrics_report = metrics.get_report()
         logger.info(metrics_report)
         print(metrics_report)
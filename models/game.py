@@ -81,6 +81,22 @@ class BirdSortGame:
                 
         return False
     
+    def cancel_selection(self):
+        """
+        Put the selected bird back on the branch it was taken from.
+        
+        Returns:
+            True if a bird was put back, False if none was selected
+        """
+        if self.selected_bird is None:
+            return False
+            
+        self.state.branches[self.selected_branch].append(self.selected_bird)
+        self.selected_bird = None
+        self.selected_branch = None
+        self.history.pop()  # Picking the bird up saved a state but made no move
+        return True
+    
     def undo(self):
         """
         Undo the last move.
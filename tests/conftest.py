@@ -0,0 +1,9 @@
+"""
+Test configuration for Bird Sort Game
+"""
+
+import os
+import sys
+
+# Make the top-level packages importable, as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,23 @@
+"""
+Tests for the Bird Sort game logic
+"""
+
+import random
+
+from models.game import BirdSortGame
+
+
+def test_cancel_selection_restores_board():
+    random.seed(0)
+    game = BirdSortGame(num_branches=7, num_colors=5)
+    before = [list(branch) for branch in game.state.branches]
+    branch = next(i for i, birds in enumerate(game.state.branches) if birds)
+    
+    game.select_branch(branch)
+    assert game.cancel_selection()
+    
+    assert game.state.branches == before
+    assert game.selected_bird is None
+    assert game.history == []
+    assert game.moves == 0
+    assert not game.cancel_selection()
@@ -0,0 +1,67 @@
+"""
+Tests for the Pygame UI solver controls
+"""
+
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from models.game import BirdSortGame
+from ui.menu_system import clear_font_cache
+from ui.pygame_ui import BirdSortGameUI
+
+
+@pytest.fixture
+def make_ui():
+    """Build UIs on a seeded game and shut pygame down afterwards"""
+    def make(seed):
+        random.seed(seed)
+        game = BirdSortGame(num_branches=7, num_colors=5)
+        return BirdSortGameUI(game, enable_solver=True)
+    yield make
+    clear_font_cache()
+    pygame.quit()
+
+
+def run_auto_solve(ui, max_steps=500):
+    """Step auto-play with a fake clock until it stops"""
+    now = 0
+    for _ in range(max_steps):
+        if not ui.auto_solving:
+            break
+        now += ui.auto_move_delay_ms
+        ui.apply_auto_move(now)
+
+
+def test_solve_while_holding_bird_ends_solved(make_ui):
+    ui = make_ui(0)  # A solvable deal
+    game = ui.game
+    branch = next(i for i, birds in enumerate(game.state.branches) if birds)
+    game.select_branch(branch)
+    assert game.selected_bird is not None
+    
+    ui._on_solve()
+    assert game.selected_bird is None
+    run_auto_solve(ui)
+    
+    assert game.is_solved()
+
+
+def test_auto_solve_replans_after_player_changes_board(make_ui):
+    ui = make_ui(0)
+    game = ui.game
+    ui._on_solve()
+    for now in (500, 1000, 1500):
+        ui.apply_auto_move(now)
+        
+    # Step off the plan: undo a move and pick up a bird
+    game.undo()
+    branch = next(i for i, birds in enumerate(game.state.branches) if birds)
+    game.select_branch(branch)
+    run_auto_solve(ui)
+    
+    assert game.is_solved()
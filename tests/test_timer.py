@@ -0,0 +1,20 @@
+"""
+Tests for the timing utilities
+"""
+
+from utils.timer import TimingStats, timed
+
+
+def test_sampled_recursion_only_times_outermost_calls():
+    stats = TimingStats()
+    
+    @timed(log=False, stats=stats, sample_rate=2)
+    def fact(n):
+        return 1 if n <= 1 else n * fact(n - 1)
+        
+    # Only the outermost calls count toward the sample: the 2nd and 4th
+    results = [fact(n) for n in (5, 6, 7, 8)]
+    
+    assert results == [120, 720, 5040, 40320]
+    assert stats.get_stats("fact")["count"] == 2
+    assert len(fact.history) == 2
@@ -16,7 +16,7 @@ except ImportError:
             "button": (200, 200, 200),
             "button_text": (0, 0, 0),
             "win_text": (0, 128, 0),
-            "bird_colors": [
+            "bird_colors": (
                 (255, 0, 0),    # Red
                 (0, 255, 0),    # Green
                 (0, 0, 255),    # Blue
@@ -25,7 +25,7 @@ except ImportError:
                 (0, 255, 255),  # Cyan
                 (255, 165, 0),  # Orange
                 (128, 0, 128)   # Purple
-            ]
+            )
         }
         return default_colors
         
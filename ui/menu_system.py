@@ -2,6 +2,8 @@
 Menu system for the Bird Sort game
 """
 
+from functools import lru_cache
+
 try:
     import pygame
     PYGAME_AVAILABLE = True
@@ -10,6 +12,32 @@ except ImportError:
     
 from .themes import get_color_scheme, get_available_themes
 
+@lru_cache(maxsize=16)
+def _load_font(name, size):
+    """Load a system font (cached by get_font)"""
+    return pygame.font.SysFont(name, size)
+
+def get_font(name, size):
+    """
+    Get a system font, loading it only once per (name, size).
+    
+    Args:
+        name: Font family name
+        size: Font size in points
+        
+    Returns:
+        A pygame Font object
+    """
+    if not pygame.font.get_init():
+        # Fonts loaded before a pygame.quit() are dead, start over
+        _load_font.cache_clear()
+        pygame.font.init()
+    return _load_font(name, size)
+
+def clear_font_cache():
+    """Drop every cached font; call before pygame.quit()"""
+    _load_font.cache_clear()
+
 class MenuSystem:
     """
     Handles menus for the Bird Sort game.
@@ -26,12 +54,16 @@ class MenuSystem:
         self.screen = screen
         self.theme = get_color_scheme(theme)
         
+        # Cache the screen size so draw() doesn't query the surface every frame
+        if PYGAME_AVAILABLE:
+            self._w, self._h = self.screen.get_size()
+        self._overlay = None
+        
         # Create fonts if pygame is available
         if PYGAME_AVAILABLE and font is None:
-            pygame.font.init()
-            self.title_font = pygame.font.SysFont('Arial', 36)
-            self.menu_font = pygame.font.SysFont('Arial', 24)
-            self.small_font = pygame.font.SysFont('Arial', 18)
+            self.title_font = get_font('Arial', 36)
+            self.menu_font = get_font('Arial', 24)
+            self.small_font = get_font('Arial', 18)
         else:
             self.title_font = font
             self.menu_font = font
@@ -128,15 +160,16 @@ class MenuSystem:
         if not self.active or not PYGAME_AVAILABLE:
             return
             
-        # Draw semi-transparent background
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # Draw semi-transparent background (built once, in the display's format)
+        if self._overlay is None:
+            self._overlay = pygame.Surface((self._w, self._h)).convert()
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(200)
+        self.screen.blit(self._overlay, (0, 0))
         
         # Draw menu title
         title_text = self.title_font.render(self.current_menu.capitalize(), True, self.theme["text"])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_rect = title_text.get_rect(center=(self._w // 2, 100))
         self.screen.blit(title_text, title_rect)
         
         # Draw menu items
@@ -147,11 +180,11 @@ class MenuSystem:
             if i == self.selected_item:
                 # Draw selection rectangle
                 rect = pygame.Rect(0, 0, 300, 40)
-                rect.center = (self.screen.get_width() // 2, 180 + i * 50)
+                rect.center = (self._w // 2, 180 + i * 50)
                 pygame.draw.rect(self.screen, self.theme["button"], rect)
                 pygame.draw.rect(self.screen, color, rect, 2)
             
             # Draw item text
             item_text = self.menu_font.render(item["text"], True, color)
-            item_rect = item_text.get_rect(center=(self.screen.get_width() // 2, 180 + i * 50))
+            item_rect = item_text.get_rect(center=(self._w // 2, 180 + i * 50))
             self.screen.blit(item_text, item_rect)
\ No newline at end of file
@@ -6,19 +6,71 @@ try:
     import pygame
     import sys
     import time
+    from functools import cached_property, lru_cache
+    from models.state import BirdSortState
     from search.astar import astar_search, extract_solution_path, get_child_states
     from ui.themes import get_color_scheme
-    from ui.menu_system import MenuSystem
+    from ui.menu_system import MenuSystem, clear_font_cache, get_font
     
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
 
 if PYGAME_AVAILABLE:
+    def _ticks():
+        """
+        Milliseconds on a monotonic clock, as an int.
+        
+        pygame.time.get_ticks() reads 0 until the SDL timer subsystem is
+        initialized, which pygame.display.init() alone does not do.
+        """
+        return time.monotonic_ns() // 1000000
+    
+    @lru_cache(maxsize=128)
+    def _solve(state_key):
+        """
+        Run A* from a hashable start state and memoize the result.
+        
+        Args:
+            state_key: Tuple of branch tuples describing the start state
+            
+        Returns:
+            A (path_keys, moves) tuple, or None if there is no solution. path_keys
+            holds the state keys from the start state to the goal and moves[i]
+            is the (from_branch, to_branch) move from path_keys[i] to path_keys[i+1]
+        """
+        start_state = BirdSortState([list(branch) for branch in state_key])
+        goal_node = astar_search(
+            start_state,
+            lambda state: state.is_goal_state(),
+            get_child_states,
+            weight=1.5  # Use weighted A* for faster solutions
+        )
+        
+        if not goal_node:
+            return None
+        path_keys = tuple(tuple(tuple(branch) for branch in state.branches)
+                          for state in extract_solution_path(goal_node))
+        
+        # Recover the move behind each step once, so playback doesn't re-diff states
+        moves = []
+        for cur, nxt in zip(path_keys, path_keys[1:]):
+            from_branch = next(i for i, (a, b) in enumerate(zip(cur, nxt)) if len(a) > len(b))
+            to_branch = next(i for i, (a, b) in enumerate(zip(cur, nxt)) if len(a) < len(b))
+            moves.append((from_branch, to_branch))
+        
+        return path_keys, tuple(moves)
+    
     class BirdSortGameUI:
         """
         Pygame-based UI for the Bird Sort game.
         """
+        # Longest time to block waiting for input when nothing is animating
+        IDLE_WAIT_MS = 50
+        
+        # Maximum number of states kept in the per-game solution cache
+        SOLVE_CACHE_SIZE = 256
+        
         def __init__(self, game, enable_solver=False, theme="default", player=None):
             """
             Initialize the UI.
@@ -33,8 +85,9 @@ if PYGAME_AVAILABLE:
             self.enable_solver = enable_solver
             self.player = player
             
-            # Initialize pygame
-            pygame.init()
+            # Initialize only the pygame subsystems the UI uses
+            pygame.display.init()
+            pygame.font.init()
             
             # Constants
             self.SCREEN_WIDTH = 800
@@ -44,6 +97,7 @@ if PYGAME_AVAILABLE:
             self.BIRD_SIZE = 25  # Radius
             
             # Get color scheme
+            self.theme_name = theme
             self.theme = get_color_scheme(theme)
             self.BIRD_COLORS = self.theme["bird_colors"]
             
@@ -52,26 +106,123 @@ if PYGAME_AVAILABLE:
             pygame.display.set_caption("Bird Sort Game")
             
             # Create fonts
-            self.font = pygame.font.SysFont('Arial', 24)
-            self.small_font = pygame.font.SysFont('Arial', 18)
+            self.font = get_font('Arial', 24)
+            self.small_font = get_font('Arial', 18)
+            
+            # Everything pre-rendered below is converted to the display's pixel
+            # format, which needs the display mode to be set first
+            assert pygame.display.get_surface() is not None
             
-            # Create menu system
-            self.menu = MenuSystem(self.screen, theme=theme)
+            # Pre-render text that doesn't change between frames
+            self._build_text_cache()
             
-            # Calculate branch positions
+            # Pre-render one bird sprite per color
+            self._build_bird_sprites()
+            
+            # The menu and the large win-message font are created on first use
+            
+            # Calculate branch and bird positions
             self.branch_positions = self.calculate_branch_positions()
+            self.bird_positions = self.calculate_bird_positions()
             
             # Solver variables
             self.solution_path = None
+            self.solution_moves = None  # (from_branch, to_branch) for each path step
             self.solution_index = 0
+            self._solve_cache = {}  # state key -> (path keys, moves) from that state
             self.auto_solving = False
+            self.auto_move_delay_ms = 500
             self.last_auto_move_time = 0
             
             # AI mode variables
             self.ai_mode = player is not None and hasattr(player, 'make_move')
             self.ai_auto_play = False
-            self.ai_move_delay = 0.5  # seconds
+            self.ai_move_delay_ms = 500
             self.last_ai_move_time = 0
+            
+            # Clickable areas: (rect, handler) for buttons, one rect per branch
+            self._buttons = [
+                (pygame.Rect(20, 60, 100, 40), self._on_undo),
+                (pygame.Rect(130, 60, 100, 40), self._on_reset)
+            ]
+            if self.enable_solver:
+                self._buttons.append((pygame.Rect(240, 60, 100, 40), self._on_hint))
+                self._buttons.append((pygame.Rect(350, 60, 100, 40), self._on_solve))
+            if self.ai_mode:
+                self._buttons.append((pygame.Rect(460, 60, 100, 40), self._on_ai_toggle))
+            self._branch_rects = [
+                pygame.Rect(x, self.SCREEN_HEIGHT - self.BRANCH_HEIGHT, 
+                            self.BRANCH_WIDTH, self.BRANCH_HEIGHT)
+                for x in self.branch_positions
+            ]
+            
+            # Pre-render the parts of the scene that never move
+            self._build_static_background()
+            
+            # Last known mouse position, tracked from mouse events in run()
+            self._mouse_pos = (0, 0)
+            
+            # What the last drawn frame showed (None forces a redraw)
+            self._prev_frame_key = None
+            
+            # Screen areas touched by the current and previous frame
+            self._dirty_rects = []
+            self._prev_dirty_rects = []
+            self._full_redraw = True
+            self._drawn_ai_label = None
+        
+        def _build_text_cache(self):
+            """Render the constant button labels for the current theme"""
+            button_text_color = self.theme["button_text"]
+            self._button_labels = {
+                label: self.small_font.render(label, True, button_text_color).convert_alpha()
+                for label in ("Undo", "Reset", "Hint", "Solve", "AI Play", "AI Stop")
+            }
+            # (move count, rendered surface, screen rect) of the last drawn moves counter
+            self._moves_cache = (-1, None, None)
+        
+        @cached_property
+        def menu(self):
+            """The in-game menu, created the first time it is needed"""
+            return MenuSystem(self.screen, theme=self.theme_name)
+        
+        @cached_property
+        def big_font(self):
+            """Font for the win message, loaded the first time it is needed"""
+            return get_font('Arial', 48)
+        
+        @cached_property
+        def _win_message(self):
+            """The rendered win message and its centered screen rect"""
+            surf = self.big_font.render("You Win!", True, self.theme["win_text"]).convert_alpha()
+            return surf, surf.get_rect(center=(self.SCREEN_WIDTH//2, self.SCREEN_HEIGHT//2))
+        
+        def _build_bird_sprites(self):
+            """Render each bird color (fill plus outline) to its own alpha surface"""
+            size = 2 * self.BIRD_SIZE + 2
+            center = (self.BIRD_SIZE + 1, self.BIRD_SIZE + 1)
+            
+            self._bird_sprites = []
+            for color in self.BIRD_COLORS:
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, center, self.BIRD_SIZE)
+                pygame.draw.circle(sprite, (0, 0, 0), center, self.BIRD_SIZE, 2)
+                self._bird_sprites.append(sprite.convert_alpha())
+        
+        def _build_static_background(self):
+            """Render the background, branches and button boxes to an off-screen surface"""
+            background = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT)).convert()
+            background.fill(self.theme["background"])
+            
+            # Draw branches (brown rectangles)
+            for rect in self._branch_rects:
+                pygame.draw.rect(background, self.theme["branch"], rect)
+            
+            # Draw button boxes
+            for rect, _ in self._buttons:
+                pygame.draw.rect(background, self.theme["button"], rect)
+            
+            self._static_bg = background
         
         def calculate_branch_positions(self):
             """Calculate x-position for each branch"""
@@ -85,77 +236,130 @@ if PYGAME_AVAILABLE:
                 
             return positions
         
-        def draw(self):
-            """Draw the game state"""
-            # Draw background
-            self.screen.fill(self.theme["background"])
-            
-            # Draw branches
-            for i, x in enumerate(self.branch_positions):
-                # Draw branch (brown rectangle)
-                pygame.draw.rect(self.screen, self.theme["branch"], 
-                                (x, self.SCREEN_HEIGHT - self.BRANCH_HEIGHT, 
-                                 self.BRANCH_WIDTH, self.BRANCH_HEIGHT))
+        def calculate_bird_positions(self):
+            """
+            Calculate where each bird slot's sprite is drawn.
+            
+            Returns:
+                A list with, for each branch, the top-left sprite position of
+                every slot from bottom to top
+            """
+            offset = self.BIRD_SIZE + 1  # Sprites are positioned by their corner
+            slots = range(4)  # Each branch holds up to 4 birds
+            
+            positions = []
+            for x in self.branch_positions:
+                bird_x = x + self.BRANCH_WIDTH // 2 - offset
+                positions.append([
+                    (bird_x, self.SCREEN_HEIGHT - 50 - (j * self.BIRD_SIZE * 2) - offset)
+                    for j in slots
+                ])
                 
-                # Draw birds in this branch
-                branch = self.game.state.branches[i]
-                for j, bird_color in enumerate(branch):
-                    # Calculate bird position (bottom to top)
-                    bird_y = self.SCREEN_HEIGHT - 50 - (j * self.BIRD_SIZE * 2)
-                    
-                    # Draw bird (colored circle)
-                    color = self.BIRD_COLORS[bird_color - 1]  # Adjust for 1-based indexing
-                    pygame.draw.circle(self.screen, color, 
-                                      (x + self.BRANCH_WIDTH // 2, bird_y), 
-                                      self.BIRD_SIZE)
-                    
-                    # Draw bird outline
-                    pygame.draw.circle(self.screen, (0, 0, 0), 
-                                      (x + self.BRANCH_WIDTH // 2, bird_y), 
-                                      self.BIRD_SIZE, 2)
+            return positions
+        
+        def _frame_key(self):
+            """
+            Describe everything draw() depends on, so unchanged frames can be skipped.
+            
+            Returns:
+                A tuple that compares equal for frames that would look identical
+            """
+            selected_bird = self.game.selected_bird
+            return (
+                self._state_key(self.game.state),  # Snapshot, the state is mutated in place
+                self.game.moves,
+                selected_bird,
+                self._mouse_pos if selected_bird is not None else None,
+                self.menu.active,
+                self.menu.current_menu,
+                self.menu.selected_item,
+                self.ai_auto_play
+            )
+        
+        def _next_events(self):
+            """
+            Collect pending events, sleeping until one arrives when nothing is due.
+            
+            Returns:
+                A list of pygame events
+            """
+            # How long until the next auto/AI move, or the idle poll interval
+            now = _ticks()
+            due = []
+            if self.auto_solving:
+                due.append(self.last_auto_move_time + self.auto_move_delay_ms - now)
+            if self.ai_mode and self.ai_auto_play:
+                due.append(self.last_ai_move_time + self.ai_move_delay_ms - now)
+            timeout_ms = min(due) if due else self.IDLE_WAIT_MS
+            
+            if timeout_ms > 0:
+                event = pygame.event.wait(timeout_ms)
+                if event.type != pygame.NOEVENT:
+                    return [event] + pygame.event.get()
+            return pygame.event.get()
+        
+        def _invalidate(self):
+            """Force the next frame to be redrawn and presented in full"""
+            self._prev_frame_key = None
+            self._full_redraw = True
+        
+        def draw(self):
+            """Draw the game state, recording the areas that changed"""
+            dirty = self._dirty_rects
+            
+            # Draw background, branches and button boxes in one blit
+            self.screen.blit(self._static_bg, (0, 0))
+            
+            # Everything else is collected here and blitted in a single call
+            ops = []
+            
+            sprites = self._bird_sprites
+            for branch, slots in zip(self.game.state.branches, self.bird_positions):
+                # Draw birds in this branch, bottom to top (1-based color index)
+                for bird_color, pos in zip(branch, slots):
+                    ops.append((sprites[bird_color - 1], pos))
             
             # Draw selected bird (if any)
             if self.game.selected_bird is not None:
-                # Draw at mouse position
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                color = self.BIRD_COLORS[self.game.selected_bird - 1]  # Adjust for 1-based indexing
-                pygame.draw.circle(self.screen, color, 
-                                  (mouse_x, mouse_y), self.BIRD_SIZE)
-                pygame.draw.circle(self.screen, (0, 0, 0), 
-                                  (mouse_x, mouse_y), self.BIRD_SIZE, 2)
-            
-            # Draw UI elements
-            moves_text = self.font.render(f"Moves: {self.game.moves}", True, self.theme["text"])
-            self.screen.blit(moves_text, (20, 20))
-            
-            # Draw buttons
-            button_bg = self.theme["button"]
-            button_text_color = self.theme["button_text"]
+                # Draw at mouse position (sprites are positioned by their corner)
+                offset = self.BIRD_SIZE + 1
+                mouse_x, mouse_y = self._mouse_pos
+                sprite = self._bird_sprites[self.game.selected_bird - 1]
+                ops.append((sprite, (mouse_x - offset, mouse_y - offset)))
+            
+            # Only the birds move around from frame to frame
+            num_bird_ops = len(ops)
+            
+            # Draw UI elements (re-render the counter only when it changes)
+            if self._moves_cache[0] != self.game.moves:
+                moves_text = self.font.render(f"Moves: {self.game.moves}", True, self.theme["text"]).convert_alpha()
+                moves_rect = moves_text.get_rect(topleft=(20, 20))
+                
+                # Cover the old text too, it may have been wider
+                old_rect = self._moves_cache[2]
+                dirty.append(moves_rect.union(old_rect) if old_rect else moves_rect)
+                self._moves_cache = (self.game.moves, moves_text, moves_rect)
+            ops.append((self._moves_cache[1], (20, 20)))
             
-            pygame.draw.rect(self.screen, button_bg, (20, 60, 100, 40))
-            undo_text = self.small_font.render("Undo", True, button_text_color)
-            self.screen.blit(undo_text, (50, 70))
+            # Draw button labels (the boxes are part of the static background)
+            labels = self._button_labels
             
-            pygame.draw.rect(self.screen, button_bg, (130, 60, 100, 40))
-            reset_text = self.small_font.render("Reset", True, button_text_color)
-            self.screen.blit(reset_text, (160, 70))
+            ops.append((labels["Undo"], (50, 70)))
+            ops.append((labels["Reset"], (160, 70)))
             
             if self.enable_solver:
-                pygame.draw.rect(self.screen, button_bg, (240, 60, 100, 40))
-                hint_text = self.small_font.render("Hint", True, button_text_color)
-                self.screen.blit(hint_text, (270, 70))
-                
-                pygame.draw.rect(self.screen, button_bg, (350, 60, 100, 40))
-                solve_text = self.small_font.render("Solve", True, button_text_color)
-                self.screen.blit(solve_text, (380, 70))
+                ops.append((labels["Hint"], (270, 70)))
+                ops.append((labels["Solve"], (380, 70)))
             
             if self.ai_mode:
-                pygame.draw.rect(self.screen, button_bg, (460, 60, 100, 40))
-                ai_text = self.small_font.render(
-                    "AI Play" if not self.ai_auto_play else "AI Stop", 
-                    True, button_text_color
-                )
-                self.screen.blit(ai_text, (480, 70))
+                ai_label = "AI Stop" if self.ai_auto_play else "AI Play"
+                ops.append((labels[ai_label], (480, 70)))
+                if ai_label != self._drawn_ai_label:
+                    dirty.append(pygame.Rect(460, 60, 100, 40))
+                    self._drawn_ai_label = ai_label
+            
+            # Static labels repaint identical pixels, so only bird rects are dirty
+            dirty.extend(self.screen.blits(ops)[:num_bird_ops])
             
             # Draw menu if active
             self.menu.draw()
@@ -165,45 +369,16 @@ if PYGAME_AVAILABLE:
             # If menu is active, let it handle the click
             if self.menu.active:
                 return
-                
-            mouse_x, mouse_y = pos
             
             # Check if click is on a button
-            if 20 <= mouse_x <= 120 and 60 <= mouse_y <= 100:
-                # Undo button
-                self.game.undo()
-                return
-                
-            if 130 <= mouse_x <= 230 and 60 <= mouse_y <= 100:
-                # Reset button
-                self.game.reset()
-                self.solution_path = None
-                self.auto_solving = False
-                self.ai_auto_play = False
-                return
-                
-            if self.enable_solver:
-                if 240 <= mouse_x <= 340 and 60 <= mouse_y <= 100:
-                    # Hint button
-                    self.get_hint()
-                    return
-                    
-                if 350 <= mouse_x <= 450 and 60 <= mouse_y <= 100:
-                    # Solve button
-                    self.auto_solving = not self.auto_solving
-                    if self.auto_solving and not self.solution_path:
-                        self.solve_game()
+            for rect, handler in self._buttons:
+                if rect.collidepoint(pos):
+                    handler()
                     return
             
-            if self.ai_mode and 460 <= mouse_x <= 560 and 60 <= mouse_y <= 100:
-                # AI Play/Stop button
-                self.ai_auto_play = not self.ai_auto_play
-                return
-            
             # Check if click is on a branch
-            for i, x in enumerate(self.branch_positions):
-                if x <= mouse_x <= x + self.BRANCH_WIDTH and \
-                   self.SCREEN_HEIGHT - self.BRANCH_HEIGHT <= mouse_y <= self.SCREEN_HEIGHT:
+            for i, rect in enumerate(self._branch_rects):
+                if rect.collidepoint(pos):
                     # Click is on this branch
                     if self.player and hasattr(self.player, 'make_move') and not self.ai_auto_play:
                         self.player.make_move(i)
@@ -211,91 +386,156 @@ if PYGAME_AVAILABLE:
                         self.game.select_branch(i)
                     break
         
+        def _on_undo(self):
+            """Undo button"""
+            self.game.undo()
+        
+        def _on_reset(self):
+            """Reset button"""
+            self.game.reset()
+            self.solution_path = None
+            self.auto_solving = False
+            self.ai_auto_play = False
+        
+        def _on_hint(self):
+            """Hint button"""
+            self.get_hint()
+        
+        def _on_solve(self):
+            """Solve button"""
+            self.auto_solving = not self.auto_solving
+            if self.auto_solving:
+                # Auto-play replays whole moves, so it can't start with a bird in hand
+                self.game.cancel_selection()
+                if not self.solution_path:
+                    self.solve_game()
+        
+        def _on_ai_toggle(self):
+            """AI Play/Stop button"""
+            self.ai_auto_play = not self.ai_auto_play
+        
         def get_hint(self):
             """Get a hint for the next move"""
-            if not self.solution_path:
+            # Re-plan if the game has left the known path (cheap once cached)
+            if (not self.solution_path or
+                    self._state_key(self.solution_path[self.solution_index]) != self._board_key()):
                 self.solve_game()
                 
-            if self.solution_path and len(self.solution_path) > 1:
+            if self.solution_path and len(self.solution_path) > self.solution_index + 1:
                 # Highlight the branch to select
-                current_state = self.game.state
-                next_state = self.solution_path[1]
+                i = self.solution_moves[self.solution_index][0]
+                print(f"Hint: Select a bird from branch {i+1}")
+                
+                # Highlight the branch
+                pygame.draw.rect(self.screen, (255, 255, 0), 
+                                (self.branch_positions[i], 
+                                 self.SCREEN_HEIGHT - self.BRANCH_HEIGHT, 
+                                 self.BRANCH_WIDTH, self.BRANCH_HEIGHT), 3)
+                pygame.display.flip()
+                pygame.time.delay(1000)  # Highlight for 1 second
                 
-                # Find the branch that changed
-                for i in range(len(current_state.branches)):
-                    if len(current_state.branches[i]) > len(next_state.branches[i]):
-                        # This branch lost a bird
-                        print(f"Hint: Select a bird from branch {i+1}")
-                        
-                        # Highlight the branch
-                        pygame.draw.rect(self.screen, (255, 255, 0), 
-                                        (self.branch_positions[i], 
-                                         self.SCREEN_HEIGHT - self.BRANCH_HEIGHT, 
-                                         self.BRANCH_WIDTH, self.BRANCH_HEIGHT), 3)
-                        pygame.display.flip()
-                        pygame.time.delay(1000)  # Highlight for 1 second
-                        break
+                # The highlight was drawn outside draw(), so repaint next frame
+                self._invalidate()
         
         def solve_game(self):
             """Solve the game using A* search"""
             print("Solving game...")
             start_time = time.time()
             
-            # Use A* search to find a solution
-            goal_node = astar_search(
-                self.game.state,
-                lambda state: state.is_goal_state(),
-                get_child_states,
-                weight=1.5  # Use weighted A* for faster solutions
-            )
+            # Reuse any earlier solution that passed through this state
+            state_key = self._board_key()
+            solution = self._solve_cache.get(state_key)
+            
+            if solution is None:
+                # Use A* search to find a solution (cached per start state)
+                solution = _solve(state_key)
+                if solution:
+                    self._remember_solution(*solution)
             
-            if goal_node:
-                self.solution_path = extract_solution_path(goal_node)
+            if solution:
+                path_keys, moves = solution
+                self.solution_path = [BirdSortState([list(branch) for branch in key])
+                                      for key in path_keys]
+                self.solution_moves = moves
                 self.solution_index = 0
                 print(f"Solution found in {len(self.solution_path)-1} moves")
                 print(f"Solving time: {time.time() - start_time:.2f} seconds")
             else:
                 print("No solution found")
         
-        def apply_auto_move(self):
-            """Apply the next move from the solution path"""
+        @staticmethod
+        def _state_key(state):
+            """Hashable (tuple of branch tuples) key for a BirdSortState"""
+            return tuple(tuple(branch) for branch in state.branches)
+            
+        def _board_key(self):
+            """
+            Key for the current board, with any bird being held put back.
+            
+            Returns:
+                A tuple of branch tuples; while a bird is held the game state is
+                missing it, which would otherwise look like a different (and
+                unsolvable) puzzle
+            """
+            branches = [tuple(branch) for branch in self.game.state.branches]
+            if self.game.selected_bird is not None:
+                held = self.game.selected_branch
+                branches[held] += (self.game.selected_bird,)
+            return tuple(branches)
+        
+        def _remember_solution(self, path_keys, moves):
+            """
+            Cache a solution path under every state along it.
+            
+            Args:
+                path_keys: Tuple of state keys from a start state to the goal
+                moves: Tuple of (from_branch, to_branch) moves between those states
+            """
+            cache = self._solve_cache
+            for i, key in enumerate(path_keys):
+                cache[key] = (path_keys[i:], moves[i:])
+            
+            # Evict the oldest entries first
+            while len(cache) > self.SOLVE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        
+        def apply_auto_move(self, current_time):
+            """
+            Apply the next move from the solution path.
+            
+            Args:
+                current_time: Current time in milliseconds, from _ticks()
+            """
             if not self.solution_path or self.solution_index >= len(self.solution_path) - 1:
                 self.auto_solving = False
                 return
                 
-            current_time = time.time()
-            if current_time - self.last_auto_move_time < 0.5:
-                return  # Wait before making the next move
-                
-            current_state = self.game.state
-            next_state = self.solution_path[self.solution_index + 1]
-            
-            # Find the branches that changed
-            from_branch = None
-            to_branch = None
-            
-            for i in range(len(current_state.branches)):
-                if len(current_state.branches[i]) > len(next_state.branches[i]):
-                    from_branch = i
-                elif len(current_state.branches[i]) < len(next_state.branches[i]):
-                    to_branch = i
-            
-            if from_branch is not None and to_branch is not None:
-                # Make the move
-                self.game.select_branch(from_branch)
-                self.game.select_branch(to_branch)
-                self.solution_index += 1
-                self.last_auto_move_time = current_time
-        
-        def apply_ai_move(self):
-            """Apply an AI move"""
-            if not self.ai_mode or not self.ai_auto_play:
-                return
-                
-            current_time = time.time()
-            if current_time - self.last_ai_move_time < self.ai_move_delay:
-                return  # Wait before making the next move
-                
+            # Only replay the plan onto the board it was made for; re-plan if the
+            # player has moved or picked up a bird since
+            if (self.game.selected_bird is not None or
+                    self._state_key(self.solution_path[self.solution_index]) !=
+                    self._state_key(self.game.state)):
+                self.game.cancel_selection()
+                self.solve_game()
+                if (not self.solution_path or
+                        self._state_key(self.solution_path[0]) != self._state_key(self.game.state)):
+                    self.auto_solving = False  # No plan for this board
+                return  # Play the new plan from the next call
+                    
+            # Make the move recorded for this step
+            from_branch, to_branch = self.solution_moves[self.solution_index]
+            self.game.select_branch(from_branch)
+            self.game.select_branch(to_branch)
+            self.solution_index += 1
+            self.last_auto_move_time = current_time
+        
+        def apply_ai_move(self, current_time):
+            """
+            Apply an AI move.
+            
+            Args:
+                current_time: Current time in milliseconds, from _ticks()
+            """
             # Let the AI make a move
             if self.player and hasattr(self.player, 'make_move'):
                 self.player.make_move()
@@ -307,14 +547,20 @@ if PYGAME_AVAILABLE:
             clock = pygame.time.Clock()
             
             while running:
-                for event in pygame.event.get():
+                for event in self._next_events():
                     if event.type == pygame.QUIT:
                         running = False
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        self._invalidate()
+                    elif event.type == pygame.MOUSEMOTION:
+                        self._mouse_pos = event.pos
                     elif event.type == pygame.MOUSEBUTTONDOWN:
-                        self.handle_click(pygame.mouse.get_pos())
+                        self._mouse_pos = event.pos
+                        self.handle_click(event.pos)
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             self.menu.toggle()
+                            self._invalidate()
                         elif self.menu.active:
                             if event.key == pygame.K_UP:
                                 self.menu.navigate(-1)
@@ -327,14 +573,17 @@ if PYGAME_AVAILABLE:
                                 elif action == "new_game":
                                     self.game.reset()
                                     self.menu.toggle()
+                                    self._invalidate()
                 
-                # Apply auto move if auto-solving
-                if self.auto_solving:
-                    self.apply_auto_move()
-                
-                # Apply AI move if in AI mode
-                if self.ai_mode:
-                    self.apply_ai_move()
+                # Apply auto/AI moves only when one is active and its delay has passed
+                if self.auto_solving or self.ai_auto_play:
+                    now = _ticks()
+                    if (self.auto_solving and
+                            now - self.last_auto_move_time >= self.auto_move_delay_ms):
+                        self.apply_auto_move(now)
+                    if (self.ai_mode and self.ai_auto_play and
+                            now - self.last_ai_move_time >= self.ai_move_delay_ms):
+                        self.apply_ai_move(now)
                 
                 # Check for win
                 if self.game.is_solved():
@@ -348,38 +597,51 @@ if PYGAME_AVAILABLE:
                     pygame.time.delay(500)
                     
                     # Show win message
-                    font = pygame.font.SysFont('Arial', 48)
-                    win_text = font.render("You Win!", True, self.theme["win_text"])
-                    text_rect = win_text.get_rect(center=(self.SCREEN_WIDTH//2, self.SCREEN_HEIGHT//2))
-                    self.screen.blit(win_text, text_rect)
+                    self.screen.blit(*self._win_message)
                     pygame.display.flip()
                     
-                    # Wait for a click to continue
+                    # Wait for a click to continue (blocks instead of spinning)
                     waiting = True
                     while waiting:
-                        for event in pygame.event.get():
-                            if event.type == pygame.QUIT:
-                                running = False
-                                waiting = False
-                            elif event.type == pygame.MOUSEBUTTONDOWN:
-                                waiting = False
+                        event = pygame.event.wait()
+                        if event.type == pygame.QUIT:
+                            running = False
+                            waiting = False
+                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                            waiting = False
                     
                     # Reset the game
                     self.game.reset()
                     self.solution_path = None
                     self.auto_solving = False
                     self.ai_auto_play = False
+                    self._invalidate()
+                
+                # Skip drawing when the frame would be identical to the last one
+                frame_key = self._frame_key()
+                if frame_key == self._prev_frame_key:
+                    clock.tick(60)
+                    continue
+                self._prev_frame_key = frame_key
                 
                 # Draw everything
                 self.draw()
                 
-                # Update the display
-                pygame.display.flip()
+                # Update the display: the menu overlay covers the whole screen,
+                # otherwise only what this frame or the previous one touched
+                if self._full_redraw or self.menu.active:
+                    pygame.display.flip()
+                    self._full_redraw = False
+                else:
+                    pygame.display.update(self._prev_dirty_rects + self._dirty_rects)
+                self._prev_dirty_rects = self._dirty_rects
+                self._dirty_rects = []
                 
                 # Control game speed
                 clock.tick(60)
             
-            # Quit pygame
+            # Quit pygame (cached fonts don't survive it)
+            clear_font_cache()
             pygame.quit()
             return 0
 else:
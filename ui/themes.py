@@ -2,6 +2,9 @@
 Color schemes and visual settings for the Bird Sort game
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # Define color schemes
 COLOR_SCHEMES = {
     "default": {
@@ -11,7 +14,7 @@ COLOR_SCHEMES = {
         "button": (200, 200, 200),
         "button_text": (0, 0, 0),
         "win_text": (0, 128, 0),
-        "bird_colors": [
+        "bird_colors": (
             (255, 0, 0),    # Red
             (0, 255, 0),    # Green
             (0, 0, 255),    # Blue
@@ -20,7 +23,7 @@ COLOR_SCHEMES = {
             (0, 255, 255),  # Cyan
             (255, 165, 0),  # Orange
             (128, 0, 128)   # Purple
-        ]
+        )
     },
     "dark": {
         "background": (40, 40, 40),
@@ -29,7 +32,7 @@ COLOR_SCHEMES = {
         "button": (80, 80, 80),
         "button_text": (220, 220, 220),
         "win_text": (0, 200, 0),
-        "bird_colors": [
+        "bird_colors": (
             (220, 50, 50),    # Red
             (50, 220, 50),    # Green
             (50, 50, 220),    # Blue
@@ -38,7 +41,7 @@ COLOR_SCHEMES = {
             (50, 220, 220),   # Cyan
             (220, 140, 40),   # Orange
             (140, 50, 140)    # Purple
-        ]
+        )
     },
     "pastel": {
         "background": (245, 245, 255),
@@ -47,7 +50,7 @@ COLOR_SCHEMES = {
         "button": (210, 210, 230),
         "button_text": (60, 60, 80),
         "win_text": (80, 180, 80),
-        "bird_colors": [
+        "bird_colors": (
             (255, 150, 150),  # Pastel Red
             (150, 255, 150),  # Pastel Green
             (150, 150, 255),  # Pastel Blue
@@ -56,10 +59,17 @@ COLOR_SCHEMES = {
             (150, 255, 255),  # Pastel Cyan
             (255, 200, 150),  # Pastel Orange
             (200, 150, 255)   # Pastel Purple
-        ]
+        )
     }
 }
 
+# Freeze the schemes so the same mapping can be shared by every UI object
+COLOR_SCHEMES = MappingProxyType({
+    name: MappingProxyType(scheme) for name, scheme in COLOR_SCHEMES.items()
+})
+_THEMES = tuple(COLOR_SCHEMES.keys())
+
+@lru_cache(maxsize=8)
 def get_color_scheme(theme_name="default"):
     """
     Get a color scheme by name.
@@ -68,7 +78,7 @@ def get_color_scheme(theme_name="default"):
         theme_name: Name of the theme to use
         
     Returns:
-        A dictionary containing color values for the theme
+        A read-only mapping containing color values for the theme
     """
     if theme_name not in COLOR_SCHEMES:
         theme_name = "default"
@@ -80,6 +90,6 @@ def get_available_themes():
     Get a list of available theme names.
     
     Returns:
-        A list of theme names
+        A tuple of theme names
     """
-    return list(COLOR_SCHEMES.keys())
\ No newline at end of file
+    return _THEMES
\ No newline at end of file
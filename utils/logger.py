@@ -2,14 +2,22 @@
 Logging utility for Bird Sort Game
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 class Logger:
-    """Custom logger for Bird Sort Game"""
+    """
+    Custom logger for Bird Sort Game.
+    
+    The level methods take logging-style %-format args, which are only
+    formatted if the message is actually emitted.
+    """
     
     LEVELS = {
         "DEBUG": logging.DEBUG,
@@ -19,7 +27,7 @@ class Logger:
         "CRITICAL": logging.CRITICAL
     }
     
-    def __init__(self, name="bird_sort", level="INFO", log_file=None, console=True):
+    def __init__(self, name="bird_sort", level="INFO", log_file=None, console=None):
         """
         Initialize the logger.
         
@@ -27,7 +35,8 @@ class Logger:
             name: Logger name
             level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_file: Optional file path for logging
-            console: Whether to log to console
+            console: Whether to log to console (None: only if the
+                     BIRDSORT_LOG_CONSOLE environment variable is "1")
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(self.LEVELS.get(level.upper(), logging.INFO))
@@ -43,6 +52,8 @@ class Logger:
         )
         
         # Add console handler if requested
+        if console is None:
+            console = os.environ.get("BIRDSORT_LOG_CONSOLE") == "1"
         if console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
@@ -55,33 +66,34 @@ class Logger:
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir)
                 
-            file_handler = logging.FileHandler(log_file)
+            # Don't open the file until the first record is actually written
+            file_handler = logging.FileHandler(log_file, delay=True)
             file_handler.setFormatter(formatter)
             self.logger.addHandler(file_handler)
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log a debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
         
-    def info(self, message):
+    def info(self, message, *args):
         """Log an info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
         
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log a warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
         
-    def error(self, message):
+    def error(self, message, *args):
         """Log an error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
         
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log a critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
         
-    def exception(self, message):
+    def exception(self, message, *args):
         """Log an exception with traceback"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
 
 class GameLogger:
@@ -105,11 +117,20 @@ class GameLogger:
             log_file = os.path.join(log_dir, f"game_{timestamp}.log")
             
         self.logger = Logger(name="game_events", level="INFO", log_file=log_file)
+        
+        # Hand the real handlers to a background thread so moves never wait on I/O
+        target = self.logger.logger
+        self._queue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, *target.handlers, respect_handler_level=True)
+        target.handlers = [QueueHandler(self._queue)]
+        self._listener.start()
+        atexit.register(self.close)
+        
         self.move_count = 0
         self.start_time = time.time()
         
         # Log game start
-        self.logger.info(f"Game started with {game.num_branches} branches and {game.num_colors} colors")
+        self.logger.info("Game started with %d branches and %d colors", game.num_branches, game.num_colors)
         self.log_state("Initial state")
         
     def log_move(self, from_branch, to_branch):
@@ -121,7 +142,9 @@ class GameLogger:
             to_branch: Target branch index
         """
         self.move_count += 1
-        self.logger.info(f"Move {self.move_count}: Branch {from_branch+1} -> Branch {to_branch+1}")
+        if not self.logger.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Move %d: Branch %d -> Branch %d", self.move_count, from_branch + 1, to_branch + 1)
         self.log_state(f"After move {self.move_count}")
         
     def log_state(self, label="Current state"):
@@ -131,13 +154,20 @@ class GameLogger:
         Args:
             label: Label for the state
         """
-        state_str = str(self.game.state).replace("\n", " | ")
-        self.logger.info(f"{label}: {state_str}")
+        if not self.logger.logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Same text as str(state) with newlines as separators, built in one pass
+        state_str = " | ".join(f"Branch {i+1}: {branch}"
+                               for i, branch in enumerate(self.game.state.branches))
+        self.logger.info("%s: %s", label, state_str)
         
     def log_undo(self):
         """Log an undo operation"""
         self.move_count -= 1
-        self.logger.info(f"Undo to move {self.move_count}")
+        if not self.logger.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Undo to move %d", self.move_count)
         self.log_state(f"After undo (move {self.move_count})")
         
     def log_reset(self):
@@ -150,7 +180,15 @@ class GameLogger:
     def log_win(self):
         """Log a game win"""
         elapsed = time.time() - self.start_time
-        self.logger.info(f"Game solved in {self.move_count} moves and {elapsed:.2f} seconds")
+        self.logger.info("Game solved in %d moves and %.2f seconds", self.move_count, elapsed)
+        
+    def close(self):
+        """Flush queued log records and stop the background writer"""
+        if self._listener is not None:
+            self._listener.stop()
+            # Later records go straight to the real handlers again
+            self.logger.logger.handlers = list(self._listener.handlers)
+            self._listener = None
         
     def log_algorithm_stats(self, algorithm, nodes_expanded, time_taken):
         """
@@ -161,7 +199,7 @@ class GameLogger:
             nodes_expanded: Number of nodes expanded
             time_taken: Time taken in seconds
         """
-        self.logger.info(f"Algorithm: {algorithm}")
-        self.logger.info(f"Nodes expanded: {nodes_expanded}")
-        self.logger.info(f"Time taken: {time_taken:.4f} seconds")
-        self.logger.info(f"Nodes per second: {nodes_expanded/time_taken:.2f}")
\ No newline at end of file
+        self.logger.info("Algorithm: %s", algorithm)
+        self.logger.info("Nodes expanded: %d", nodes_expanded)
+        self.logger.info("Time taken: %.4f seconds", time_taken)
+        self.logger.info("Nodes per second: %.2f", nodes_expanded / time_taken)
\ No newline at end of file
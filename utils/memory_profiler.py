@@ -5,32 +5,135 @@ Memory profiling for Bird Sort Game
 import tracemalloc
 import linecache
 import os
+import tempfile
+import weakref
+from functools import lru_cache
+
+# mprofile is a sampling, tracemalloc-compatible tracer with far lower overhead
+try:
+    import mprofile
+    MPROFILE_AVAILABLE = True
+except ImportError:
+    MPROFILE_AVAILABLE = False
+
+# memray also sees allocations made by C extensions such as numpy
+try:
+    import memray
+    MEMRAY_AVAILABLE = True
+except ImportError:
+    MEMRAY_AVAILABLE = False
+
+# Source files show up in every listing, so their display names are memoized
+_basename = lru_cache(maxsize=256)(os.path.basename)
+
+# Statistics already computed for each live snapshot, keyed by grouping
+_stats_cache = weakref.WeakKeyDictionary()
+
+def _statistics(snapshot, key_type):
+    """
+    Get a snapshot's statistics, computing them only once per grouping.
+    
+    Args:
+        snapshot: Memory snapshot to analyze
+        key_type: Type of grouping ('lineno', 'traceback', etc.)
+        
+    Returns:
+        The list from snapshot.statistics(key_type), shared between callers
+    """
+    cached = _stats_cache.setdefault(snapshot, {})
+    if key_type not in cached:
+        cached[key_type] = snapshot.statistics(key_type)
+    return cached[key_type]
 
 class MemoryProfiler:
     """Track memory usage during algorithm execution"""
-    def __init__(self):
+    __slots__ = ('backend', 'tracking', 'sample_rate', 'nframes', 'memray_file',
+                 'peak_usage', '_tracker', '_tracer', '_owns_tracer')
+    
+    def __init__(self, sample_rate=128 * 1024, nframes=1, backend=None,
+                 memray_file=None):
+        """
+        Initialize the profiler.
+        
+        Args:
+            sample_rate: Average bytes between sampled allocations when mprofile
+                is installed (1 traces every allocation); ignored by tracemalloc
+            nframes: Stack frames stored per allocation. The default of 1 keeps
+                tracing cheap, but tracebacks then show only the allocation site
+            backend: "tracemalloc" or "memray" (or None to read the
+                BIRDSORT_MEMPROF environment variable); memray falls back to
+                tracemalloc when it isn't installed
+            memray_file: Capture file written by the memray backend (None for
+                one in the system temp directory)
+        """
+        if backend is None:
+            backend = os.environ.get("BIRDSORT_MEMPROF", "tracemalloc")
+        self.backend = "memray" if backend == "memray" and MEMRAY_AVAILABLE else "tracemalloc"
         self.tracking = False
+        self.sample_rate = sample_rate
+        self.nframes = nframes
+        self.memray_file = memray_file or os.path.join(
+            tempfile.gettempdir(), f"birdsort_memray_{os.getpid()}.bin")
+        self.peak_usage = 0  # memray only knows the peak once stopped
+        self._tracker = None
+        self._tracer = mprofile if MPROFILE_AVAILABLE else tracemalloc
+        self._owns_tracer = False
         
     def start(self):
-        """Start tracking memory usage"""
-        tracemalloc.start()
+        """
+        Start tracking memory usage.
+        
+        If the tracer is already running (e.g. an outer profiling session), it
+        is shared rather than restarted, and left running by stop(); figures
+        then cover the outer session too.
+        """
+        self._owns_tracer = True
+        if self.backend == "memray":
+            self._tracker = memray.Tracker(
+                destination=memray.FileDestination(self.memray_file, overwrite=True),
+                native_traces=False
+            )
+            self._tracker.__enter__()
+        elif self._tracer.is_tracing():
+            self._owns_tracer = False
+        elif MPROFILE_AVAILABLE:
+            mprofile.start(max_frames=self.nframes, sample_rate=self.sample_rate)
+        else:
+            tracemalloc.start(self.nframes)
         self.tracking = True
         
     def stop(self):
-        """Stop tracking memory usage"""
-        if self.tracking:
-            tracemalloc.stop()
-            self.tracking = False
+        """
+        Stop tracking memory usage.
+        
+        Returns:
+            The peak traced memory in bytes over the session (0 if not tracking)
+        """
+        if not self.tracking:
+            return 0
+        if self._tracker:
+            self._tracker.__exit__(None, None, None)
+            self._tracker = None
+            self.peak_usage = memray.FileReader(self.memray_file).metadata.peak_memory
+        else:
+            self.peak_usage = self._tracer.get_traced_memory()[1]
+            if self._owns_tracer:
+                self._tracer.stop()
+        self.tracking = False
+        return self.peak_usage
             
     def get_current_usage(self):
         """
         Get current memory usage.
         
         Returns:
-            A tuple of (current, peak) memory usage in bytes
+            A tuple of (current, peak) memory usage in bytes. The memray
+            backend has no live figures and reports (0, peak) after stop()
         """
+        if self.backend == "memray":
+            return 0, self.peak_usage
         if self.tracking:
-            current, peak = tracemalloc.get_traced_memory()
+            current, peak = self._tracer.get_traced_memory()
             return current, peak
         return 0, 0
         
@@ -39,10 +142,11 @@ class MemoryProfiler:
         Get a snapshot of memory usage.
         
         Returns:
-            A tracemalloc snapshot or None if not tracking
+            A tracemalloc (or mprofile) snapshot or None if not tracking
+            (always None with the memray backend; inspect memray_file instead)
         """
-        if self.tracking:
-            return tracemalloc.take_snapshot()
+        if self.tracking and self.backend != "memray":
+            return self._tracer.take_snapshot()
         return None
         
     def compare_snapshots(self, snapshot1, snapshot2):
@@ -57,8 +161,12 @@ class MemoryProfiler:
             A list of statistics comparing the two snapshots
         """
         if snapshot1 and snapshot2:
-            stats = snapshot2.compare_to(snapshot1, 'lineno')
-            return stats
+            # Cached on the newer snapshot, checking the older one is the same object
+            cached = _stats_cache.setdefault(snapshot2, {})
+            key = ('compare', id(snapshot1))
+            if key not in cached or cached[key][0]() is not snapshot1:
+                cached[key] = (weakref.ref(snapshot1), snapshot2.compare_to(snapshot1, 'lineno'))
+            return cached[key][1]
         return None
     
     def display_top(self, snapshot, key_type='lineno', limit=10):
@@ -76,13 +184,19 @@ class MemoryProfiler:
         if not snapshot:
             return "No snapshot available"
             
-        top_stats = snapshot.statistics(key_type)
+        top_stats = _statistics(snapshot, key_type)
         
         result = []
         result.append("Top memory users:")
+        checked = set()
         for index, stat in enumerate(top_stats[:limit], 1):
             frame = stat.traceback[0]
-            filename = os.path.basename(frame.filename)
+            filename = _basename(frame.filename)
+            
+            # Make sure cached source lines are current, once per file
+            if frame.filename not in checked:
+                linecache.checkcache(frame.filename)
+                checked.add(frame.filename)
             line = linecache.getline(frame.filename, frame.lineno).strip()
             size_kb = stat.size / 1024
             result.append(f"#{index}: {filename}:{frame.lineno}: {size_kb:.1f} KB - {line}")
@@ -2,15 +2,160 @@
 Performance metrics tracking for Bird Sort Game
 """
 
+import gc
+import json
 import time
 import os
+import threading
 import psutil
 
+from .memory_profiler import MemoryProfiler
+
+# (size in bytes, name) of each unit, largest first
+_MEMORY_UNITS = ((1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
+def _format_memory(size):
+    """
+    Format a memory size with the largest unit it exceeds.
+    
+    Args:
+        size: Memory size in bytes
+        
+    Returns:
+        A string such as "1.50 MB"
+    """
+    for unit_size, unit in _MEMORY_UNITS:
+        if size > unit_size:
+            return f"{size / unit_size:.2f} {unit}"
+    return f"{size} bytes"
+
+class _MemSampler(threading.Thread):
+    """Background thread that polls a process's RSS and keeps per-operation peaks"""
+    def __init__(self, process, interval):
+        """
+        Initialize the sampler.
+        
+        Args:
+            process: psutil.Process to sample
+            interval: Seconds between samples
+        """
+        super().__init__(daemon=True)
+        self.process = process
+        self.interval = interval
+        self.last_rss = None
+        self.peaks = {}  # operation name -> highest RSS seen since it was tracked
+        self.ready = threading.Event()  # Set once a sample is in
+        self._wake = threading.Event()
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        
+    def run(self):
+        """Sample until stopped, parking while no operation is tracked"""
+        while not self._done.is_set():
+            rss = self.process.memory_info().rss
+            with self._lock:
+                self._wake.clear()
+                self.last_rss = rss
+                for name, peak in self.peaks.items():
+                    if peak is None or rss > peak:
+                        self.peaks[name] = rss
+                self.ready.set()
+                parked = not self.peaks
+            self._wake.wait(None if parked else self.interval)
+            
+    def track(self, name):
+        """
+        Start (or restart) tracking the peak RSS for an operation.
+        
+        Args:
+            name: Name of the operation
+            
+        Returns:
+            The most recently sampled RSS in bytes
+        """
+        with self._lock:
+            parked = not self.peaks
+            if parked:
+                # The last sample may be old, wake the thread for a fresh one
+                self.peaks[name] = None
+                self.ready.clear()
+                self._wake.set()
+            else:
+                self.peaks[name] = self.last_rss
+        if parked:
+            self.ready.wait()
+        return self.last_rss
+            
+    def peak(self, name):
+        """
+        Get the peak RSS seen so far for a tracked operation.
+        
+        Args:
+            name: Name of the operation
+            
+        Returns:
+            The peak RSS in bytes, or None if the operation isn't tracked
+        """
+        with self._lock:
+            return self.peaks.get(name)
+            
+    def untrack(self, name):
+        """
+        Stop tracking an operation.
+        
+        Args:
+            name: Name of the operation
+            
+        Returns:
+            A (latest RSS, peak RSS) tuple, or None if it wasn't tracked
+        """
+        with self._lock:
+            if name not in self.peaks:
+                return None
+            return self.last_rss, self.peaks.pop(name)
+            
+    def finish(self):
+        """Stop sampling"""
+        self._done.set()
+        self._wake.set()
+        self.join()
+
 class PerformanceMetrics:
     """Track and analyze algorithm performance"""
-    def __init__(self):
+    def __init__(self, sample_interval=0.01):
+        """
+        Initialize the metrics tracker.
+        
+        Args:
+            sample_interval: Seconds between background RSS samples while a
+                timer is running (the sampler sleeps while none is)
+        """
         self.metrics = {}
         self.process = psutil.Process(os.getpid())
+        self.sample_interval = sample_interval
+        self._sampler = None
+        
+    def _get_sampler(self):
+        """Get the shared RSS sampler, starting it on first use"""
+        if self._sampler is None:
+            self._sampler = _MemSampler(self.process, self.sample_interval)
+            self._sampler.start()
+            self._sampler.ready.wait()
+        return self._sampler
+        
+    def close(self):
+        """Stop the background RSS sampler, if it was started"""
+        if self._sampler is not None:
+            self._sampler.finish()
+            self._sampler = None
+            
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+        
+    def __exit__(self, *args):
+        """Context manager exit, stops the sampler"""
+        self.close()
         
     def start_timer(self, name):
         """
@@ -19,9 +164,10 @@ class PerformanceMetrics:
         Args:
             name: Name of the operation to time
         """
+        # Memory comes from the sampler thread, not a syscall on this one
         self.metrics[name] = {
-            "start_time": time.time(),
-            "start_memory": self.process.memory_info().rss,
+            "start_time": time.perf_counter(),
+            "start_memory": self._get_sampler().track(name),
             "nodes_expanded": 0,
             "max_memory": 0
         }
@@ -34,9 +180,93 @@ class PerformanceMetrics:
             name: Name of the operation to stop timing
         """
         if name in self.metrics:
-            self.metrics[name]["elapsed_time"] = time.time() - self.metrics[name]["start_time"]
-            self.metrics[name]["memory_used"] = self.process.memory_info().rss - self.metrics[name]["start_memory"]
+            data = self.metrics[name]
+            data["elapsed_time"] = time.perf_counter() - data["start_time"]
+            
+            sampled = self._sampler.untrack(name) if self._sampler else None
+            if sampled:
+                last_rss, peak_rss = sampled
+                data["memory_used"] = last_rss - data["start_memory"]
+                data["max_memory"] = max(data["max_memory"], peak_rss)
+            
+    def benchmark(self, name, algorithm_func, runs=1, detailed=False, results_file=None):
+        """
+        Time repeated runs of an algorithm and record them under a name.
+        
+        Memory is measured from background RSS samples; tracemalloc is only
+        started when a per-line breakdown is asked for. The garbage collector
+        is run before and paused during each run so collection pauses don't
+        land in the timings; allocations, and so peak memory, are unaffected.
+        
+        Args:
+            name: Name to record the results under
+            algorithm_func: Callable taking no arguments to benchmark
+            runs: Number of times to run it
+            detailed: Also trace allocations and keep a snapshot of them
+            results_file: Optional JSON Lines file to append this result to
             
+        Returns:
+            The result of the last run
+        """
+        if runs < 1:
+            raise ValueError(f"runs must be at least 1, got {runs}")
+            
+        profiler = MemoryProfiler() if detailed else None
+        if profiler:
+            profiler.start()
+            
+        times = []
+        self.start_timer(name)
+        
+        # Prime the CPU counter; the next call reports usage since this one
+        self.process.cpu_percent(None)
+        try:
+            gc_was_enabled = gc.isenabled()
+            for _ in range(runs):
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    result = algorithm_func()
+                    times.append(time.perf_counter() - start)
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+        finally:
+            cpu_percent = self.process.cpu_percent(None)
+            self.stop_timer(name)
+            if profiler:
+                # The snapshot needs a live tracer; memray only knows its peak once stopped
+                self.metrics[name]["snapshot"] = profiler.get_snapshot()
+                self.metrics[name]["traced_peak"] = profiler.stop()
+                
+        self.metrics[name]["runs"] = runs
+        self.metrics[name]["avg_time"] = sum(times) / runs
+        self.metrics[name]["cpu_percent"] = cpu_percent
+        
+        # Append one line per result so earlier results survive a crash
+        if results_file:
+            record = {"name": name}
+            record.update((key, value) for key, value in self.metrics[name].items()
+                          if key not in ("start_time", "snapshot"))
+            with open(results_file, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+        return result
+        
+    @staticmethod
+    def load_results(results_file):
+        """
+        Read back results appended by benchmark().
+        
+        Args:
+            results_file: JSON Lines file written by benchmark()
+            
+        Returns:
+            A list of result dictionaries, oldest first
+        """
+        with open(results_file) as f:
+            return [json.loads(line) for line in f if line.strip()]
+        
     def record_nodes_expanded(self, name, count):
         """
         Record number of nodes expanded during search.
@@ -54,11 +284,13 @@ class PerformanceMetrics:
         
         Args:
             name: Name of the operation
-            usage: Memory usage in bytes, or None to measure current usage
+            usage: Memory usage in bytes, or None to use the sampled peak so far
         """
         if name in self.metrics:
             if usage is None:
-                usage = self.process.memory_info().rss
+                usage = self._sampler.peak(name) if self._sampler else None
+                if usage is None:
+                    return
             self.metrics[name]["max_memory"] = max(self.metrics[name].get("max_memory", 0), usage)
             
     def get_report(self):
@@ -72,20 +304,12 @@ class PerformanceMetrics:
         for name, data in self.metrics.items():
             report.append(f"\n{name}:")
             report.append(f"  Time: {data.get('elapsed_time', 'N/A'):.4f} seconds")
+            if 'runs' in data:
+                report.append(f"  Avg time: {data['avg_time']:.4f} seconds over {data['runs']} runs")
+                report.append(f"  CPU: {data['cpu_percent']:.1f}%")
             report.append(f"  Nodes expanded: {data.get('nodes_expanded', 'N/A')}")
             
-            # Format memory usage
-            max_memory = data.get('max_memory', 0)
-            if max_memory > 1024 * 1024 * 1024:
-                memory_str = f"{max_memory / (1024 * 1024 * 1024):.2f} GB"
-            elif max_memory > 1024 * 1024:
-                memory_str = f"{max_memory / (1024 * 1024):.2f} MB"
-            elif max_memory > 1024:
-                memory_str = f"{max_memory / 1024:.2f} KB"
-            else:
-                memory_str = f"{max_memory} bytes"
-                
-            report.append(f"  Max memory: {memory_str}")
+            report.append(f"  Max memory: {_format_memory(data.get('max_memory', 0))}")
             
             # Calculate nodes per second
             if 'elapsed_time' in data and data['elapsed_time'] > 0 and 'nodes_expanded' in data:
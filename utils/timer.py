@@ -2,42 +2,101 @@
 Timer utility for Bird Sort Game
 """
 
+import atexit
+import sys
+import threading
 import time
-from functools import wraps
+from array import array
+from collections import deque
+from time import perf_counter as _clock
+from functools import lru_cache, partial, wraps
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Resolution, monotonicity and implementation of the clock Timer reads
+CLOCK_INFO = time.get_clock_info('perf_counter')
+
+# Clocks a Timer can read, all in integer nanoseconds
+_CLOCKS = {
+    'perf': time.perf_counter_ns,
+    'process': time.process_time_ns  # CPU time of this process only
+}
+if hasattr(time, 'CLOCK_MONOTONIC_RAW'):
+    # Not slewed by NTP; Linux only
+    _CLOCKS['monotonic_raw'] = partial(time.clock_gettime_ns, time.CLOCK_MONOTONIC_RAW)
+
+# Formatter for times in reports, bound once
+_FMT = "{:.4f}".format
+
+# Timing lines from timed() waiting to be written to stdout in one go
+_LOG_BUF = deque()
+_FLUSH_EVERY = 256
+
+def _flush():
+    """Write out any buffered timing lines"""
+    if _LOG_BUF:
+        lines = [_LOG_BUF.popleft() for _ in range(len(_LOG_BUF))]
+        sys.stdout.write("\n".join(lines) + "\n")
+
+atexit.register(_flush)
 
 class Timer:
     """Utility for timing operations"""
-    def __init__(self, name=None):
+    __slots__ = ('name', 'start_ns', 'elapsed_total_ns', 'running', 'calls', '_idle_ns',
+                 '_last_stop_ns', '_clock_ns')
+    
+    def __init__(self, name=None, clock='perf'):
         """
         Initialize a timer.
         
         Args:
             name: Optional name for the timer
+            clock: Clock to read: 'perf' (perf_counter), 'process' (CPU time)
+                or, where supported, 'monotonic_raw'
         """
+        if clock not in _CLOCKS:
+            raise ValueError(f"Unknown clock {clock!r}, expected one of {sorted(_CLOCKS)}")
+        self._clock_ns = _CLOCKS[clock]
         self.name = name or "Timer"
-        self.start_time = None
-        self.elapsed = 0
+        
+        # Times are kept as integer nanoseconds so totals add up exactly
+        self.start_ns = None
+        self.elapsed_total_ns = 0
         self.running = False
+        self.calls = 0  # Completed start/stop intervals
+        self._idle_ns = 0
+        self._last_stop_ns = None
         
     def start(self):
         """Start the timer"""
         if not self.running:
-            self.start_time = time.time()
+            self.start_ns = self._clock_ns()
+            if self._last_stop_ns is not None:
+                self._idle_ns += self.start_ns - self._last_stop_ns
             self.running = True
         return self
         
     def stop(self):
         """Stop the timer and record elapsed time"""
         if self.running:
-            self.elapsed += time.time() - self.start_time
+            self._last_stop_ns = self._clock_ns()
+            self.elapsed_total_ns += self._last_stop_ns - self.start_ns
+            self.calls += 1
             self.running = False
         return self
         
     def reset(self):
         """Reset the timer"""
-        self.start_time = None
-        self.elapsed = 0
+        self.start_ns = None
+        self.elapsed_total_ns = 0
         self.running = False
+        self.calls = 0
+        self._idle_ns = 0
+        self._last_stop_ns = None
         return self
         
     def restart(self):
@@ -45,6 +104,23 @@ class Timer:
         self.reset()
         return self.start()
         
+    @property
+    def elapsed_ns(self):
+        """Elapsed time in integer nanoseconds, including a running interval"""
+        if self.running:
+            return self.elapsed_total_ns + (self._clock_ns() - self.start_ns)
+        return self.elapsed_total_ns
+        
+    @property
+    def elapsed(self):
+        """Elapsed time in seconds"""
+        return self.elapsed_ns * 1e-9
+        
+    @property
+    def elapsed_ms(self):
+        """Elapsed time in milliseconds"""
+        return self.elapsed_ns * 1e-6
+        
     def get_elapsed(self):
         """
         Get the elapsed time.
@@ -52,14 +128,32 @@ class Timer:
         Returns:
             Elapsed time in seconds
         """
-        if self.running:
-            return self.elapsed + (time.time() - self.start_time)
-        return self.elapsed
+        return self.elapsed_ns * 1e-9
+        
+    @property
+    def busy(self):
+        """Time spent between start() and stop(), in seconds"""
+        return self.elapsed_ns * 1e-9
+        
+    @property
+    def idle(self):
+        """Time spent between a stop() and the following start(), in seconds"""
+        return self._idle_ns * 1e-9
+        
+    @property
+    def total(self):
+        """Busy plus idle time, from first start to last stop on the timer's clock"""
+        return (self.elapsed_ns + self._idle_ns) * 1e-9
+        
+    @property
+    def rps(self):
+        """Completed intervals per second of total time (throughput)"""
+        total = self.total
+        return self.calls / total if total else 0.0
         
     def __enter__(self):
         """Context manager entry"""
-        self.start()
-        return self
+        return self.start()
         
     def __exit__(self, *args):
         """Context manager exit"""
@@ -67,10 +161,11 @@ class Timer:
         
     def __str__(self):
         """String representation"""
-        return f"{self.name}: {self.get_elapsed():.4f} seconds"
+        return self.name + ": " + _FMT(self.get_elapsed()) + " seconds"
 
 
-def timed(func=None, *, name=None, logger=None):
+def timed(func=None, *, name=None, logger=None, log=True, stats=None, sample_rate=1,
+          memoize=False, max_size=256, immediate=False):
     """
     Decorator for timing function execution.
     
@@ -78,25 +173,82 @@ def timed(func=None, *, name=None, logger=None):
         func: Function to time
         name: Optional name for the timer
         logger: Optional logger to log timing information
+        log: Whether to log/print each call's time; turn off for hot functions
+            and collect the timings in stats instead
+        stats: Optional TimingStats to record each call's time in
+        sample_rate: Only time every Nth call; the recorded times are then a
+            sample whose mean estimates the per-call time
+        memoize: Also cache results with functools.lru_cache (arguments must
+            be hashable); the log line then includes the cache hit counts
+        max_size: Maximum number of cached results when memoizing
+        immediate: Print each line as it happens; by default lines for stdout
+            are buffered and written every 256 calls and at exit
+            
+    Only outermost calls are counted and timed: recursive calls are part of
+    the outer call's time, whether or not that call was sampled. The decorated function
+    keeps its return value; the latest time is left on its last_elapsed
+    attribute and the most recent 1024 times in its history deque.
         
     Returns:
         Decorated function
     """
+    if not isinstance(sample_rate, int) or isinstance(sample_rate, bool) or sample_rate < 1:
+        raise ValueError(f"sample_rate must be an int >= 1, got {sample_rate!r}")
+        
     def decorator(f):
+        if memoize:
+            f = lru_cache(maxsize=max_size)(f)
+        # Everything that doesn't change between calls is worked out here
+        timer_name = name or f.__name__
+        header = timer_name + ": "
+        calls = 0
+        history = deque(maxlen=1024)
+        active = threading.local()  # Per thread: is an outermost call in progress?
+        
         @wraps(f)
         def wrapper(*args, **kwargs):
-            timer_name = name or f.__name__
-            timer = Timer(timer_name)
-            timer.start()
+            nonlocal calls
+            if getattr(active, 'outer', False):
+                return f(*args, **kwargs)
+                
+            calls += 1
+            active.outer = True
+            if calls % sample_rate:
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    active.outer = False
+                    
+            # Read the clock directly, a Timer object is more than this needs
+            start = _clock()
             try:
-                result = f(*args, **kwargs)
-                return result
+                return f(*args, **kwargs)
             finally:
-                timer.stop()
-                if logger:
-                    logger.info(f"{timer}")
-                else:
-                    print(f"{timer}")
+                elapsed = _clock() - start
+                active.outer = False
+                wrapper.last_elapsed = elapsed
+                history.append(elapsed)
+                if stats is not None:
+                    stats.record(timer_name, elapsed)
+                if log:
+                    message = header + _FMT(elapsed) + " seconds"
+                    if memoize:
+                        info = f.cache_info()
+                        message += f" (cache hits: {info.hits}, misses: {info.misses})"
+                    if logger:
+                        logger.info(message)
+                    elif immediate:
+                        print(message)
+                    else:
+                        _LOG_BUF.append(message)
+                        if len(_LOG_BUF) >= _FLUSH_EVERY:
+                            _flush()
+                        
+        wrapper.last_elapsed = None
+        wrapper.history = history
+        if memoize:
+            wrapper.cache_info = f.cache_info
+            wrapper.cache_clear = f.cache_clear
         return wrapper
         
     if func is None:
@@ -106,6 +258,8 @@ def timed(func=None, *, name=None, logger=None):
 
 class TimingStats:
     """Collect and analyze timing statistics"""
+    __slots__ = ('timings',)
+    
     def __init__(self):
         self.timings = {}
         
@@ -118,7 +272,7 @@ class TimingStats:
             elapsed: Elapsed time in seconds
         """
         if name not in self.timings:
-            self.timings[name] = []
+            self.timings[name] = array('d')
         self.timings[name].append(elapsed)
         
     def get_stats(self, name):
@@ -135,12 +289,32 @@ class TimingStats:
             return None
             
         times = self.timings[name]
+        if NUMPY_AVAILABLE:
+            # Zero-copy view of the array buffer, each reduction is one C loop
+            values = np.frombuffer(times, dtype=np.float64)
+            return {
+                "count": values.size,
+                "total": float(values.sum()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "avg": float(values.mean()),
+                "p95": float(np.percentile(values, 95))
+            }
+            
+        total = sum(times)
+        ordered = sorted(times)
+        
+        # Linearly interpolated 95th percentile, as numpy computes it
+        pos = 0.95 * (len(ordered) - 1)
+        low = int(pos)
+        high = min(low + 1, len(ordered) - 1)
         return {
             "count": len(times),
-            "total": sum(times),
-            "min": min(times),
-            "max": max(times),
-            "avg": sum(times) / len(times)
+            "total": total,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "avg": total / len(times),
+            "p95": ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
         }
         
     def get_report(self):
@@ -160,5 +334,6 @@ class TimingStats:
                 report.append(f"  Min: {stats['min']:.4f} seconds")
                 report.append(f"  Max: {stats['max']:.4f} seconds")
                 report.append(f"  Avg: {stats['avg']:.4f} seconds")
+                report.append(f"  P95: {stats['p95']:.4f} seconds")
                 
         return "\n".join(report)
\ No newline at end of file